@@ -4,25 +4,44 @@ class toyota:
     origin = "japan"
     cars_onlot = 0
 
+    # __slots__ lists the only instance variables allowed, so instances skip the per-object __dict__
+    __slots__ = ("model", "year", "color")
+
     # instance variables only apply to the specific instance that is created from the class
     def __init__(self, model, year, color):
+        self._set(model, year, color)
+        toyota.cars_onlot += 1
+
+    # sets up one car; shared by __init__ and from_specs so both build cars the same way
+    def _set(self, model, year, color):
         self.model = model
         self.year = year
         self.color = color
-        toyota.cars_onlot += 1
+
+    # a classmethod builds several cars at once and bumps the lot count a single time
+    @classmethod
+    def from_specs(cls, specs):
+        cars = []
+        for model, year, color in specs:
+            car = cls.__new__(cls)
+            car._set(model, year, color)
+            cars.append(car)
+        toyota.cars_onlot += len(cars)
+        return cars
 
     # class mathods are things that this class can do, similar to functions
     def car_info(self):
         print(f"This is a {self.year} toyota {self.model} in {self.color}")
 
 
-car_1 = toyota("camry", 2016, "white")
-car_2 = toyota("corrola", 2025, "black")
-car_3 = toyota("4runner", 2012, "grey")
-
-car_1.car_info()
-car_2.car_info()
-car_3.car_info()
+# only run the demo when this file is run directly, not when it is imported
+if __name__ == "__main__":
+    car_1, car_2, car_3 = toyota.from_specs([("camry", 2016, "white"),
+                                             ("corrola", 2025, "black"),
+                                             ("4runner", 2012, "grey")])
 
+    car_1.car_info()
+    car_2.car_info()
+    car_3.car_info()
 
-print(toyota.cars_onlot)
+    print(toyota.cars_onlot)
@@ -8,15 +8,21 @@ car_makes_models_dic = {"kia": "forte", "mitsubishi": "galant",
 
 # this shows a dictionary with tuples as values and strings as keys
 
-car_dic = {"toyota": ["camry", "corolla", "4runner"],
-           "nissan": ("maxima", "altima", "versa"),
-           "honda": ("civic", "accord", "pilot")}
+# the makes and their models are kept in two parallel tuples, then zipped into the dictionary
+car_dic_makes = ("toyota", "nissan", "honda")
+car_dic_models = (("camry", "corolla", "4runner"),
+                  ("maxima", "altima", "versa"),
+                  ("civic", "accord", "pilot"))
+car_dic = dict(zip(car_dic_makes, car_dic_models))
 
 # this code shows a set
 
 car_set = {"toyota", "honda", "mercedes"}
 car_set.add("jeep")
 jap_car_set = {"toyota", "honda"}
-print(car_set)
-print(jap_car_set.issubset(car_set))
-print(type(car_dic))
+
+# only print when this file is run directly, not when it is imported
+if __name__ == "__main__":
+    print(car_set)
+    print(jap_car_set.issubset(car_set))
+    print(type(car_dic))
@@ -10,6 +10,20 @@ Author: ChatGPT (example starter). Edit comments and rules to match your trading
 
 from datetime import datetime, time
 import math
+import re
+
+# candlestick patterns that count as confirmation in the rules engine
+CONFIRM_PATTERNS = frozenset({"engulfing", "breakout", "pinbar", "inside"})
+
+# decimal places kept on calculated prices and distances
+PRICE_DECIMALS = 5
+
+# R multiples for take-profit suggestions
+DEFAULT_R_LEVELS = (1.0, 1.5, 2.0, 3.0)
+TP_R_LEVELS = (1.0, 1.5, 2.0)
+
+# one whole trading window, "HH:MM-HH:MM" (spaces allowed around ":" and "-", as parse_time_str does)
+_WIN_RE = re.compile(r"\s*(\d+)\s*:\s*(\d+)\s*-\s*(\d+)\s*:\s*(\d+)\s*")
 
 # ---------- Helper functions ----------
 
@@ -23,21 +37,26 @@ def parse_time_str(tstr):
         return None
 
 
+def parse_float(s):
+    """Parse a price-like string into a float. Returns None if blank or invalid."""
+    s = s.strip()
+    if not s:
+        return None
+    try:
+        return float(s)
+    except ValueError:
+        return None
+
+
 def time_in_windows(t, windows):
     """
     t: datetime.time
     windows: list of tuples (start_time, end_time) both datetime.time
     Handles windows that cross midnight (end < start).
     """
-    for s, e in windows:
-        if s <= e:
-            if s <= t <= e:
-                return True
-        else:
-            # window wraps midnight
-            if t >= s or t <= e:
-                return True
-    return False
+    # a window either runs forward (s <= e) or wraps midnight (s > e)
+    return any((s <= t <= e) if s <= e else (t >= s or t <= e)
+               for s, e in windows)
 
 
 def parse_windows_input(win_str):
@@ -45,39 +64,130 @@ def parse_windows_input(win_str):
     Accepts input like "09:30-11:30,13:00-15:00" and returns list of (start_time, end_time).
     """
     windows = []
-    parts = [p.strip() for p in win_str.split(",") if p.strip()]
-    for p in parts:
-        if "-" not in p:
+    for part in win_str.split(","):
+        m = _WIN_RE.fullmatch(part)
+        if not m:
+            continue
+        try:
+            windows.append((time(int(m[1]), int(m[2])),
+                            time(int(m[3]), int(m[4]))))
+        except ValueError:
+            # out-of-range hour/minute, skip this window
             continue
-        a, b = p.split("-")
-        ta = parse_time_str(a)
-        tb = parse_time_str(b)
-        if ta and tb:
-            windows.append((ta, tb))
     return windows
 
 
+def direction_sign(direction):
+    """Return +1.0 for a long trade and -1.0 for a short one."""
+    return 1.0 if direction == "long" else -1.0
+
+
 def suggest_stop_from_atr(entry, direction, atr, atr_multiplier=1.5):
     """Simple stop suggestion using ATR multiplier (price units)."""
     dist = atr * atr_multiplier
-    if direction == "long":
-        stop = round(entry - dist, 5)
-    else:
-        stop = round(entry + dist, 5)
-    return stop, round(dist, 5)
+    stop = round(entry - direction_sign(direction) * dist, PRICE_DECIMALS)
+    return stop, round(dist, PRICE_DECIMALS)
 
 
-def r_multiples(entry, stop, direction, r_list=(1.0, 1.5, 2.0, 3.0)):
+def suggest_stops(entry, direction, atrs, atr_multipliers=(1.5,)):
+    """
+    Stop suggestions for every ATR / multiplier pair, for calibration sweeps.
+    Returns one row per ATR, each a list of (stop, dist) per multiplier.
+    """
+    return [[suggest_stop_from_atr(entry, direction, atr, mult) for mult in atr_multipliers]
+            for atr in atrs]
+
+
+def r_multiples(entry, stop, direction, r_list=DEFAULT_R_LEVELS):
     """Return TP prices for given R multiples."""
-    stop_dist = abs(entry - stop)
-    tps = []
-    for r in r_list:
-        if direction == "long":
-            tp = round(entry + stop_dist * r, 5)
+    step = direction_sign(direction) * abs(entry - stop)
+    return [(r, round(entry + step * r, PRICE_DECIMALS)) for r in r_list]
+
+
+def score_setup(direction, structure_1h, market_env, patterns, fvg, ob, liq, in_window=None):
+    """
+    Simple rules engine. Pure function of the user's read, so it can be reused
+    outside the interactive prompts (e.g. scoring many setups in a backtest).
+    in_window: True/False from time_in_windows, or None to skip the time check.
+    Returns (score, reasons, should_trade).
+    """
+    reasons = []
+    score = 0  # higher score -> more valid
+    structure_mismatch = False
+
+    # 1) structure vs direction
+    if direction == "long":
+        if structure_1h == "higher":
+            score += 2
+        elif structure_1h == "unclear":
+            score += 0
+            reasons.append(
+                "1H structure unclear — prefer structure in trade direction.")
         else:
-            tp = round(entry - stop_dist * r, 5)
-        tps.append((r, tp))
-    return tps
+            structure_mismatch = True
+            reasons.append(
+                "1H structure is LOWER while you plan a LONG. That's a structural mismatch.")
+    else:  # short
+        if structure_1h == "lower":
+            score += 2
+        elif structure_1h == "unclear":
+            score += 0
+            reasons.append(
+                "1H structure unclear — prefer structure in trade direction.")
+        else:
+            structure_mismatch = True
+            reasons.append(
+                "1H structure is HIGHER while you plan a SHORT. That's a structural mismatch.")
+
+    # 2) market environment checks
+    if market_env == "expansion":
+        score += 1
+    elif market_env == "consolidation":
+        # breakouts could be valid but in consolidation it's riskier
+        if "breakout" in patterns:
+            reasons.append(
+                "Market consolidation — breakouts can be false; consider waiting for clear momentum.")
+            score -= 1
+    elif market_env == "reversal":
+        # reversal + engulfing/order block could be strong
+        if "engulfing" in patterns or ob == "y":
+            score += 2
+    elif market_env == "retracement":
+        # retracement into an ICT level + structure with trend favored -> good
+        if fvg == "y" or ob == "y" or liq == "y":
+            score += 1
+
+    # 3) pattern/ICT confirmation
+    ict_confirm = (fvg == "y") or (ob == "y") or (liq == "y")
+    pattern_confirm = not CONFIRM_PATTERNS.isdisjoint(patterns)
+    if ict_confirm and pattern_confirm:
+        score += 3
+    elif pattern_confirm:
+        score += 1
+        reasons.append("Pattern present but no ICT-level confirmation.")
+    elif ict_confirm:
+        score += 1
+        reasons.append(
+            "ICT level(s) present but no classic pattern; may need further price reaction.")
+    else:
+        reasons.append(
+            "No patterns or ICT levels flagged — consider waiting for clearer confluence.")
+
+    # 4) time-of-day check (skipped when in_window is None)
+    if in_window is not None:
+        if not in_window:
+            reasons.append(
+                "Setup time is outside your allowed trading windows — recommended to wait.")
+        else:
+            score += 1
+
+    # 5) final pass/fail logic
+    should_trade = True
+    # basic rule: require structure alignment and at least one confirmation (pattern or ICT)
+    if structure_mismatch or (structure_1h == "unclear" and not (pattern_confirm and ict_confirm)) or (not (pattern_confirm or ict_confirm)):
+        should_trade = False
+
+    return score, reasons, should_trade
 
 # ---------- Main logic ----------
 
@@ -87,12 +197,14 @@ def get_input(prompt, valid=None, default=None):
     Simplified input with validation.
     If valid is set to a list/tuple, input must be one of those (case-insensitive).
     """
+    # valid never changes between retries, so lowercase it once
+    valid_lc = frozenset(v.lower() for v in valid) if valid else None
     while True:
         s = input(prompt).strip()
         if s == "" and default is not None:
             return default
-        if valid:
-            if s.lower() in [v.lower() for v in valid]:
+        if valid_lc:
+            if s.lower() in valid_lc:
                 return s.lower()
             else:
                 print("  ➜ invalid option; expected one of:", valid)
@@ -127,6 +239,8 @@ def main():
                 for p in patterns_raw.split(",") if p.strip()]
     if not patterns:
         patterns = ["none"]
+    # the list keeps input order for display; the rules engine only needs membership checks
+    pattern_set = frozenset(patterns)
 
     # ICT level inputs
     fvg = get_input(
@@ -144,42 +258,23 @@ def main():
         tsetup = parse_time_str(time_setup_str)
         if not tsetup:
             print("  ➜ invalid time format; ignoring time check.")
-            tsetup = None
-            time_ok = True
-        else:
-            if trading_windows:
-                time_ok = time_in_windows(tsetup, trading_windows)
-            else:
-                time_ok = True
+        elif trading_windows:
+            time_ok = time_in_windows(tsetup, trading_windows)
 
     # entry / stop / account
     entry_s = input(
         "Entry price (e.g. 1.23456) — leave blank if you only want logic check: ").strip()
-    entry = None
-    try:
-        if entry_s != "":
-            entry = float(entry_s)
-    except:
-        entry = None
+    entry = parse_float(entry_s)
 
     stop_s = input("Stop price (leave blank to auto-calc from ATR): ").strip()
-    stop_price = None
-    try:
-        if stop_s != "":
-            stop_price = float(stop_s)
-    except:
-        stop_price = None
+    stop_price = parse_float(stop_s)
 
     atr = None
     if entry is not None and stop_price is None:
         # ask for ATR to calculate stop
         atr_s = input(
             "Enter ATR (price units) to auto-calc stop (e.g. 0.0020) or leave blank to skip: ").strip()
-        try:
-            if atr_s != "":
-                atr = float(atr_s)
-        except:
-            atr = None
+        atr = parse_float(atr_s)
 
     acct_s = input(
         "Account size (optional, e.g. 10000) or leave blank to skip position sizing: ").strip()
@@ -187,79 +282,9 @@ def main():
         "Risk percent per trade (e.g. 1 for 1%) — leave blank to skip sizing calc: ").strip()
 
     # --- Simple Rules Engine ---
-    reasons = []
-    score = 0  # higher score -> more valid
-
-    # 1) structure vs direction
-    if direction == "long":
-        if structure_1h == "higher":
-            score += 2
-        elif structure_1h == "unclear":
-            score += 0
-            reasons.append(
-                "1H structure unclear — prefer structure in trade direction.")
-        else:
-            reasons.append(
-                "1H structure is LOWER while you plan a LONG. That's a structural mismatch.")
-    else:  # short
-        if structure_1h == "lower":
-            score += 2
-        elif structure_1h == "unclear":
-            score += 0
-            reasons.append(
-                "1H structure unclear — prefer structure in trade direction.")
-        else:
-            reasons.append(
-                "1H structure is HIGHER while you plan a SHORT. That's a structural mismatch.")
-
-    # 2) market environment checks
-    if market_env == "expansion":
-        score += 1
-    elif market_env == "consolidation":
-        # breakouts could be valid but in consolidation it's riskier
-        if "breakout" in patterns:
-            reasons.append(
-                "Market consolidation — breakouts can be false; consider waiting for clear momentum.")
-            score -= 1
-    elif market_env == "reversal":
-        # reversal + engulfing/order block could be strong
-        if "engulfing" in patterns or ob == "y":
-            score += 2
-    elif market_env == "retracement":
-        # retracement into an ICT level + structure with trend favored -> good
-        if fvg == "y" or ob == "y" or liq == "y":
-            score += 1
-
-    # 3) pattern/ICT confirmation
-    ict_confirm = (fvg == "y") or (ob == "y") or (liq == "y")
-    pattern_confirm = any(p in ("engulfing", "breakout",
-                          "pinbar", "inside") for p in patterns)
-    if ict_confirm and pattern_confirm:
-        score += 3
-    elif pattern_confirm:
-        score += 1
-        reasons.append("Pattern present but no ICT-level confirmation.")
-    elif ict_confirm:
-        score += 1
-        reasons.append(
-            "ICT level(s) present but no classic pattern; may need further price reaction.")
-    else:
-        reasons.append(
-            "No patterns or ICT levels flagged — consider waiting for clearer confluence.")
-
-    # 4) time-of-day check
-    if trading_windows and time_setup_str:
-        if not time_ok:
-            reasons.append(
-                "Setup time is outside your allowed trading windows — recommended to wait.")
-        else:
-            score += 1
-
-    # 5) final pass/fail logic
-    should_trade = True
-    # basic rule: require structure alignment and at least one confirmation (pattern or ICT)
-    if ("mismatch" in " ".join(reasons).lower()) or (structure_1h == "unclear" and not (pattern_confirm and ict_confirm)) or (not (pattern_confirm or ict_confirm)):
-        should_trade = False
+    in_window = time_ok if (trading_windows and time_setup_str) else None
+    score, reasons, should_trade = score_setup(
+        direction, structure_1h, market_env, pattern_set, fvg, ob, liq, in_window)
 
     # --- stop & TP calculation ---
     suggested_stop = stop_price
@@ -275,36 +300,33 @@ def main():
                 reasons.append(
                     "No stop provided and no ATR — cannot auto-calc stop.")
         else:
-            stop_distance = round(abs(entry - stop_price), 5)
+            stop_distance = round(abs(entry - stop_price), PRICE_DECIMALS)
     else:
         reasons.append(
             "No entry price provided — TP/stop calculations skipped.")
 
+    used_stop = suggested_stop if suggested_stop is not None else stop_price
+
     tps = []
-    if entry is not None and (suggested_stop or stop_price):
-        used_stop = suggested_stop if suggested_stop is not None else stop_price
-        tps = r_multiples(entry, used_stop, direction, r_list=(1.0, 1.5, 2.0))
+    if entry is not None and used_stop is not None:
+        tps = r_multiples(entry, used_stop, direction, r_list=TP_R_LEVELS)
 
     # --- position sizing hint ---
     pos_hint = None
     try:
-        if acct_s and risk_pct_s and entry is not None and (stop_price is not None or suggested_stop is not None):
+        if acct_s and risk_pct_s and entry is not None and used_stop is not None:
             acct = float(acct_s)
             risk_pct = float(risk_pct_s)
             risk_amount = acct * (risk_pct / 100.0)
             # stop distance in price units:
-            used_stop = suggested_stop if suggested_stop is not None else stop_price
-            if used_stop is None:
-                pos_hint = "No stop price available to compute position size."
+            stop_dist_price = abs(entry - used_stop)
+            if stop_dist_price == 0:
+                pos_hint = "Stop distance is zero — cannot compute size."
             else:
-                stop_dist_price = abs(entry - used_stop)
-                if stop_dist_price == 0:
-                    pos_hint = "Stop distance is zero — cannot compute size."
-                else:
-                    # position size = risk_amount / (stop_dist_price)
-                    # This returns units of 'account currency per price unit' (e.g., for forex you'd then convert to lots).
-                    qty = risk_amount / stop_dist_price
-                    pos_hint = f"Risk ${risk_amount:.2f}. Suggested position exposure (in price-units) = {qty:.2f}."
+                # position size = risk_amount / (stop_dist_price)
+                # This returns units of 'account currency per price unit' (e.g., for forex you'd then convert to lots).
+                qty = risk_amount / stop_dist_price
+                pos_hint = f"Risk ${risk_amount:.2f}. Suggested position exposure (in price-units) = {qty:.2f}."
         elif acct_s or risk_pct_s:
             pos_hint = "Provide both account size and risk% to get a position-sizing hint."
     except Exception as e: